@@ -5,54 +5,55 @@ Extract stylized facts from LaTeX file and create CSV files per section.
 
 import re
 import csv
+from itertools import repeat
 from pathlib import Path
 
+# Precompiled patterns (avoids re-module cache lookups in the hot loop)
+# Combined pattern matching either a section header or a fact entry
+# (number & fact text & & & \\), so the whole file is scanned in a single
+# pass inside the regex engine instead of line-by-line in Python
+COMBINED_RE = re.compile(
+    r'\\section\{(?P<sec>[^}]+)\}'
+    r'|(?P<num>\d+)[ \t]+&[ \t]+(?P<fact>[^&\n]+?)&[ \t]+&[ \t]+&[ \t]+\\\\'
+)
+
+# Patterns for filename sanitization
+SANITIZE_SPECIAL_RE = re.compile(r'[^\w\s-]')
+SANITIZE_SPACES_RE = re.compile(r'[-\s]+')
+
 def extract_sections_and_facts(tex_file):
     """
     Extract section names and their associated stylized facts from LaTeX file.
-    Returns a dictionary with section names as keys and lists of facts as values.
+    Returns a dictionary mapping section names to parallel 'numbers' and
+    'texts' lists (one entry per fact).
     """
     with open(tex_file, 'r', encoding='utf-8') as f:
         content = f.read()
-    
+
     sections = {}
     current_section = None
-    
-    # Pattern to match section headers
-    section_pattern = r'\\section\{([^}]+)\}'
-    
-    # Pattern to match fact entries (number & fact text & & & \\)
-    # This captures the number and the fact text between & symbols
-    fact_pattern = r'(\d+)\s+&\s+([^&]+?)&\s+&\s+&\s+\\\\'
-    
-    lines = content.split('\n')
-    
-    for i, line in enumerate(lines):
-        # Check for section header
-        section_match = re.search(section_pattern, line)
-        if section_match:
-            current_section = section_match.group(1)
-            sections[current_section] = []
-            continue
-        
-        # Check for fact entry
-        if current_section:
-            fact_match = re.search(fact_pattern, line)
-            if fact_match:
-                fact_number = int(fact_match.group(1))
-                fact_text = fact_match.group(2).strip()
-                sections[current_section].append({
-                    'Number': fact_number,
-                    'DEB Stylized Fact': fact_text
-                })
-    
+
+    # Single pass over the whole file: the regex engine does the scanning,
+    # avoiding a Python-level loop over individual lines
+    for match in COMBINED_RE.finditer(content):
+        section_name = match.group('sec')
+        if section_name is not None:
+            current_section = section_name
+            # Parallel lists instead of one dict per fact: smaller and
+            # faster to build for thousands of facts
+            sections[current_section] = {'numbers': [], 'texts': []}
+        elif current_section:
+            facts = sections[current_section]
+            facts['numbers'].append(int(match.group('num')))
+            facts['texts'].append(match.group('fact').strip())
+
     return sections
 
 def sanitize_filename(section_name):
     """Convert section name to valid filename."""
     # Remove special characters and replace spaces with underscores
-    filename = re.sub(r'[^\w\s-]', '', section_name)
-    filename = re.sub(r'[-\s]+', '_', filename)
+    filename = SANITIZE_SPECIAL_RE.sub('', section_name)
+    filename = SANITIZE_SPACES_RE.sub('_', filename)
     return filename.lower()
 
 def create_csv_files(sections, output_dir='.'):
@@ -63,29 +64,24 @@ def create_csv_files(sections, output_dir='.'):
     created_files = []
     
     for section_name, facts in sections.items():
-        if not facts:  # Skip empty sections
+        if not facts['numbers']:  # Skip empty sections
             continue
-        
+
         filename = sanitize_filename(section_name) + '.csv'
         filepath = output_path / filename
-        
+
         with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
             fieldnames = ['Number', 'DEB Stylized Fact', 'Accuracy', 'I have an explanation', 'Importance']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            writer.writeheader()
-            for fact in facts:
-                writer.writerow({
-                    'Number': fact['Number'],
-                    'DEB Stylized Fact': fact['DEB Stylized Fact'],
-                    'Accuracy': '',
-                    'I have an explanation': '',
-                    'Importance': ''
-                })
-        
+            writer = csv.writer(csvfile)
+
+            writer.writerow(fieldnames)
+            # One C-level writerows call instead of a Python loop of writerow
+            writer.writerows(zip(facts['numbers'], facts['texts'],
+                                 repeat(''), repeat(''), repeat('')))
+
         created_files.append(filepath)
-        print(f"Created: {filepath} ({len(facts)} facts)")
-    
+        print(f"Created: {filepath} ({len(facts['numbers'])} facts)")
+
     return created_files
 
 def main():
@@ -96,7 +92,7 @@ def main():
     
     print(f"\nFound {len(sections)} sections:")
     for section_name, facts in sections.items():
-        print(f"  - {section_name}: {len(facts)} facts")
+        print(f"  - {section_name}: {len(facts['numbers'])} facts")
     
     print("\nCreating CSV files...")
     created_files = create_csv_files(sections)
@@ -104,7 +100,7 @@ def main():
     print(f"\nSuccessfully created {len(created_files)} CSV files!")
     
     # Summary
-    total_facts = sum(len(facts) for facts in sections.values())
+    total_facts = sum(len(facts['numbers']) for facts in sections.values())
     print(f"\nSummary:")
     print(f"  Total sections: {len(sections)}")
     print(f"  Total stylized facts: {total_facts}")
@@ -1,7 +1,6 @@
 """Configuration settings for DEB Literature Review System."""
 
 from pathlib import Path
-from typing import Dict
 
 class Config:
     """Main configuration class."""
@@ -17,7 +16,7 @@ class Config:
     # MongoDB
     MONGODB_URI: str = "mongodb://localhost:27017"
     MONGODB_DATABASE: str = "deb_literature_review"
-    MONGODB_COLLECTIONS: Dict[str, str] = {
+    MONGODB_COLLECTIONS: dict[str, str] = {
         "documents": "documents",
         "chunks": "document_chunks",
         "facts": "stylized_facts",
@@ -26,12 +25,31 @@ class Config:
     }
     
     # Vector Search
+    # Run similarity search inside MongoDB via $vectorSearch (Atlas only);
+    # self-hosted deployments fall back to the in-memory search
+    USE_ATLAS_VECTOR_SEARCH: bool = False
     VECTOR_INDEX_NAME: str = "vector_index"
     EMBEDDING_DIMENSIONS: int = 768
     SIMILARITY_METRIC: str = "cosine"
+    # Quantize the in-memory chunk matrix to int8 (4x smaller); set False to
+    # keep exact float32 scoring
+    QUANTIZE_EMBEDDINGS: bool = True
+    # Offline FAISS index built by scripts/build_faiss_index.py; used by the
+    # retriever when present (requires the optional faiss package)
+    FAISS_INDEX_PATH: Path = DATA_DIR / "cache" / "chunks.faiss"
+    FAISS_META_PATH: Path = DATA_DIR / "cache" / "chunks_meta.pkl"
+    # Arrow cache of chunk metadata + embeddings (requires optional pyarrow);
+    # delete the file to force a rebuild from MongoDB
+    CHUNK_CACHE_PATH: Path = DATA_DIR / "cache" / "chunks.arrow"
+    # On-disk memo of fact embeddings, keyed by model + text, so resumed
+    # runs do not re-embed
+    EMBEDDING_CACHE_PATH: Path = DATA_DIR / "cache" / "fact_embeddings.pkl"
     
     # PDF Extraction
     MAX_WORKERS_EXTRACTION: int = 4
+
+    # Embedding
+    MAX_WORKERS_EMBEDDING: int = 4
     
     # RAG Settings
     CHUNK_SIZE: int = 1000
@@ -44,6 +62,7 @@ class Config:
     # Embedding Model
     EMBEDDING_MODEL: str = "nomic-embed-text"
     OLLAMA_BASE_URL: str = "http://localhost:11434"
+    OLLAMA_KEEP_ALIVE: str = "1h"
     
     # LLM Settings
     LLM_MODEL: str = "gpt-oss:120b"
@@ -51,9 +70,13 @@ class Config:
     LLM_TOP_P: float = 0.9
     LLM_CONTEXT_SIZE: int = 32000
     LLM_REPEAT_PENALTY: float = 1.1
+    # In-flight LLM assessments; keep at 1 unless the Ollama server has
+    # spare slots. Even at 1 the pipeline overlaps LLM calls with CSV/Mongo
+    # writes
+    LLM_PARALLELISM: int = 1
     
     # Scoring Scale
-    SCORE_RANGES: Dict[str, tuple] = {
+    SCORE_RANGES: dict[str, tuple] = {
         "no_support": (1, 20),
         "weak": (21, 40),
         "moderate": (41, 60),
@@ -68,10 +91,11 @@ class Config:
     # Logging
     LOG_LEVEL: str = "INFO"
 
+    @classmethod
+    def ensure_dirs(cls):
+        """Create data directories (called lazily by the pipelines, not at import)."""
+        for path in (cls.DATA_DIR, cls.LOG_DIR, cls.CHECKPOINT_DIR):
+            path.mkdir(parents=True, exist_ok=True)
+
 # Global config instance
 config = Config()
-
-# Ensure directories exist
-config.DATA_DIR.mkdir(exist_ok=True)
-config.LOG_DIR.mkdir(exist_ok=True)
-config.CHECKPOINT_DIR.mkdir(exist_ok=True)
@@ -1,8 +1,9 @@
 """Phase 1: PDF Extraction Pipeline - Extract PDFs and store in MongoDB."""
 
 import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 from tqdm import tqdm
 import sys
 
@@ -14,10 +15,15 @@ from literature_review.phase1_extraction.pdf_extractor import PDFExtractor
 
 logger = logging.getLogger(__name__)
 
+def _extract_one(pdf_path: Path) -> Dict:
+    """Extract a single PDF (module-level so it is picklable for worker processes)."""
+    return PDFExtractor().extract_text(pdf_path)
+
 class ExtractionPipeline:
     """Pipeline for extracting PDFs and storing in MongoDB."""
     
     def __init__(self):
+        config.ensure_dirs()
         self.extractor = PDFExtractor()
         self.mongodb = mongodb
         self.mongodb.connect()
@@ -39,37 +45,45 @@ class ExtractionPipeline:
         """
         total = len(pdf_paths)
         logger.info(f"Starting extraction of {total} PDFs...")
-        
+
+        # Fetch the set of already processed filepaths with a single query
+        done = {
+            doc["filepath"]
+            for doc in self.mongodb.documents.find({}, projection={"filepath": 1})
+        }
+        pending = [p for p in pdf_paths if str(p) not in done]
+        skipped = total - len(pending)
+        if skipped:
+            logger.info(f"Skipping {skipped} already processed PDFs")
+
         batch = []
         processed = 0
         errors = 0
-        
+
+        # Extract PDFs in parallel across worker processes (CPU-bound work)
         with tqdm(total=total, desc="Extracting PDFs") as pbar:
-            for pdf_path in pdf_paths:
-                # Check if already processed
-                existing = self.mongodb.documents.find_one({"filepath": str(pdf_path)})
-                if existing:
-                    logger.debug(f"Skipping already processed: {pdf_path.name}")
+            pbar.update(skipped)
+
+            with ProcessPoolExecutor(max_workers=config.MAX_WORKERS_EXTRACTION) as executor:
+                futures = [executor.submit(_extract_one, pdf_path) for pdf_path in pending]
+
+                for future in as_completed(futures):
+                    result = future.result()
+
+                    if result["extraction_status"] == "success":
+                        batch.append(result)
+                        processed += 1
+                    else:
+                        errors += 1
+
+                    # Bulk insert batch
+                    if len(batch) >= batch_size:
+                        self.mongodb.documents.insert_many(batch)
+                        logger.info(f"Inserted batch of {len(batch)} documents")
+                        batch = []
+
                     pbar.update(1)
-                    continue
-                
-                # Extract
-                result = self.extractor.extract_text(pdf_path)
-                
-                if result["extraction_status"] == "success":
-                    batch.append(result)
-                    processed += 1
-                else:
-                    errors += 1
-                
-                # Bulk insert batch
-                if len(batch) >= batch_size:
-                    self.mongodb.documents.insert_many(batch)
-                    logger.info(f"Inserted batch of {len(batch)} documents")
-                    batch = []
-                
-                pbar.update(1)
-        
+
         # Insert remaining
         if batch:
             self.mongodb.documents.insert_many(batch)
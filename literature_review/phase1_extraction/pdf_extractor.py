@@ -1,18 +1,31 @@
 """PDF text extraction using PyMuPDF."""
 
 import fitz  # PyMuPDF
+import gzip
+import io
 import logging
+from bson.binary import Binary
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Optional
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Page count above which per-page extraction is spread over threads
+# (PyMuPDF releases the GIL during text extraction)
+PARALLEL_PAGE_THRESHOLD = 32
+
+# Texts larger than this are stored gzip-compressed to keep BSON documents
+# small (academic text compresses ~3-5x)
+COMPRESS_THRESHOLD = 64 * 1024
+
 class PDFExtractor:
     """Extract text from PDF files using PyMuPDF."""
-    
-    def __init__(self):
+
+    def __init__(self, page_workers: int = 4):
         self.logger = logger
+        self.page_workers = page_workers
     
     def extract_text(self, pdf_path: Path) -> Dict:
         """
@@ -40,21 +53,39 @@ class PDFExtractor:
             doc = fitz.open(pdf_path)
             result["page_count"] = len(doc)
             
-            # Extract text from all pages
-            text_parts = []
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                text = page.get_text()
-                if text.strip():
-                    text_parts.append(f"[Page {page_num + 1}]\n{text}")
-            
-            result["extracted_text"] = "\n\n".join(text_parts)
+            # Extract text from all pages, streaming into one buffer instead
+            # of collecting per-page strings and joining at the end.
+            # sort=False skips PyMuPDF's reading-order sort, which is not
+            # needed downstream
+            buf = io.StringIO()
+            for page_num, text in self._extract_pages(doc):
+                if text:
+                    # Plain writes instead of an f-string: no temporary
+                    # header string allocated per page
+                    buf.write("[Page ")
+                    buf.write(str(page_num + 1))
+                    buf.write("]\n")
+                    buf.write(text)
+                    buf.write("\n\n")
+
+            full_text = buf.getvalue()
+
+            # Store large texts compressed; compresslevel=3 trades a little
+            # ratio for much less CPU
+            if len(full_text) > COMPRESS_THRESHOLD:
+                result["extracted_text_gz"] = Binary(
+                    gzip.compress(full_text.encode("utf-8"), compresslevel=3)
+                )
+                del result["extracted_text"]
+            else:
+                result["extracted_text"] = full_text
+
             result["extraction_status"] = "success"
-            
+
             doc.close()
-            
+
             self.logger.info(f"✓ Extracted {pdf_path.name}: {result['page_count']} pages, "
-                           f"{len(result['extracted_text'])} chars")
+                           f"{len(full_text)} chars")
             
         except Exception as e:
             result["extraction_status"] = "failed"
@@ -62,7 +93,31 @@ class PDFExtractor:
             self.logger.error(f"✗ Failed to extract {pdf_path.name}: {e}")
         
         return result
-    
+
+    def _extract_pages(self, doc) -> list[tuple]:
+        """
+        Extract text from every page, in page order.
+
+        Large documents are spread over a thread pool; PyMuPDF releases the
+        GIL during extraction, so pages decompress and parse concurrently.
+        Small documents use a plain loop to avoid pool startup overhead.
+
+        Args:
+            doc: Open fitz document
+
+        Returns:
+            List of (page_number, text) tuples sorted by page number
+        """
+        if len(doc) <= PARALLEL_PAGE_THRESHOLD:
+            return [(page.number, page.get_text("text", sort=False)) for page in doc]
+
+        def _one_page(page_num: int) -> tuple:
+            return page_num, doc[page_num].get_text("text", sort=False)
+
+        with ThreadPoolExecutor(max_workers=self.page_workers) as executor:
+            # map preserves input order, so pages come back already sorted
+            return list(executor.map(_one_page, range(len(doc))))
+
     def extract_batch(self, pdf_paths: list[Path]) -> list[Dict]:
         """
         Extract text from multiple PDF files.
@@ -1,10 +1,51 @@
 """Document chunking and processing utilities."""
 
+import gzip
 import logging
+import re
+from bisect import bisect_right
 from typing import List, Dict
 
 logger = logging.getLogger(__name__)
 
+# Sentence end markers ('. ', '.\n', '! ', '? ', ...)
+SENTENCE_END_RE = re.compile(r'[.!?]\s')
+
+def compute_boundaries(text_length: int, breaks: List[int],
+                       chunk_size: int, chunk_overlap: int) -> List[tuple]:
+    """
+    Compute (start, end) boundaries for overlapping chunks.
+
+    Pure integer arithmetic over the precomputed sentence-break positions;
+    kept free of string operations so the loop stays cheap.
+
+    Args:
+        text_length: Length of the text being chunked
+        breaks: Sorted positions of sentence ends in the text
+        chunk_size: Target size of each chunk in characters
+        chunk_overlap: Number of characters to overlap between chunks
+
+    Returns:
+        List of (start, end) index pairs
+    """
+    boundaries = []
+    start = 0
+
+    while start < text_length:
+        end = start + chunk_size
+
+        # Break at the last sentence boundary before the target end
+        # (the boundary must lie past the overlap so the window advances)
+        if end < text_length:
+            idx = bisect_right(breaks, end)
+            if idx > 0 and breaks[idx - 1] > start + chunk_overlap:
+                end = breaks[idx - 1]
+
+        boundaries.append((start, end))
+        start = end - chunk_overlap if end < text_length else end
+
+    return boundaries
+
 class DocumentChunker:
     """Chunk documents into smaller pieces for embedding."""
     
@@ -32,27 +73,23 @@ class DocumentChunker:
         """
         if not text or len(text) == 0:
             return []
-        
+
+        # Precompute all sentence-end positions in one forward pass, so each
+        # chunk boundary is a bisect instead of repeated backward rfind scans
+        breaks = [m.start() + 1 for m in SENTENCE_END_RE.finditer(text)]
+
+        boundaries = compute_boundaries(len(text), breaks,
+                                        self.chunk_size, self.chunk_overlap)
+
         chunks = []
-        start = 0
         chunk_id = 0
-        
-        while start < len(text):
-            # Calculate end position
-            end = start + self.chunk_size
-            
-            # Try to break at sentence boundary
-            if end < len(text):
-                # Look for sentence end markers
-                for marker in ['. ', '.\n', '! ', '? ']:
-                    pos = text.rfind(marker, start, end)
-                    if pos > start:
-                        end = pos + 1
-                        break
-            
-            # Extract chunk
-            chunk_text = text[start:end].strip()
-            
+
+        for start, end in boundaries:
+            # Extract chunk (strip only when there is whitespace to trim)
+            chunk_text = text[start:end]
+            if chunk_text and (chunk_text[0].isspace() or chunk_text[-1].isspace()):
+                chunk_text = chunk_text.strip()
+
             if chunk_text:
                 chunk = {
                     "chunk_id": chunk_id,
@@ -60,16 +97,13 @@ class DocumentChunker:
                     "char_start": start,
                     "char_end": end,
                 }
-                
+
                 if metadata:
                     chunk["metadata"] = metadata
-                
+
                 chunks.append(chunk)
                 chunk_id += 1
-            
-            # Move start position (with overlap)
-            start = end - self.chunk_overlap if end < len(text) else end
-        
+
         return chunks
     
     def chunk_document(self, document: Dict) -> List[Dict]:
@@ -83,7 +117,11 @@ class DocumentChunker:
             List of chunk dictionaries ready for embedding
         """
         text = document.get("extracted_text", "")
-        
+
+        # Large texts are stored gzip-compressed by the extractor
+        if not text and "extracted_text_gz" in document:
+            text = gzip.decompress(document["extracted_text_gz"]).decode("utf-8")
+
         if not text:
             logger.warning(f"Document {document.get('filename')} has no text")
             return []
@@ -97,9 +135,11 @@ class DocumentChunker:
         
         chunks = self.chunk_text(text, metadata)
         
-        # Add document reference to each chunk
+        # Add document reference to each chunk; the needs_embedding flag is
+        # unset once the embedding pass has processed the chunk
         for chunk in chunks:
             chunk["doc_id"] = document.get("doc_id")
+            chunk["needs_embedding"] = True
         
         logger.debug(f"Chunked {document.get('filename')}: {len(chunks)} chunks")
         
@@ -1,41 +1,90 @@
 """Embedding generation using Ollama."""
 
+import hashlib
 import logging
 import ollama
+import pickle
+import threading
+from bson.binary import Binary
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import List
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+def embedding_to_binary(embedding: List[float]) -> Binary:
+    """Pack an embedding into raw float32 bytes for compact BSON storage."""
+    return Binary(np.asarray(embedding, dtype=np.float32).tobytes())
+
+def binary_to_embedding(data: bytes) -> np.ndarray:
+    """Unpack a float32 binary embedding back into a numpy vector."""
+    return np.frombuffer(data, dtype=np.float32)
+
+# Shared clients per host, so all pipeline components reuse one HTTP
+# connection pool instead of each creating their own
+_clients = {}
+
+def get_client(base_url: str) -> ollama.Client:
+    """Return a shared Ollama client for the given host."""
+    if base_url not in _clients:
+        _clients[base_url] = ollama.Client(host=base_url)
+    return _clients[base_url]
+
 class EmbeddingGenerator:
     """Generate embeddings using Ollama."""
-    
-    def __init__(self, model: str = "nomic-embed-text", base_url: str = "http://localhost:11434"):
+
+    def __init__(self, model: str = "nomic-embed-text", base_url: str = "http://localhost:11434",
+                 max_workers: int = 4, keep_alive: str = "1h", cache_path: Path = None):
         """
         Initialize embedding generator.
-        
+
         Args:
             model: Ollama model to use for embeddings
             base_url: Ollama server URL
+            max_workers: Number of concurrent embedding requests
+            keep_alive: How long the server keeps the model loaded between calls
+            cache_path: Optional pickle file memoizing embeddings across runs
         """
         self.model = model
         self.base_url = base_url
-        self.client = ollama.Client(host=base_url)
+        self.max_workers = max_workers
+        self.keep_alive = keep_alive
+        self.cache_path = cache_path
+        self.client = get_client(base_url)
+        self._cache = None
+        self._cache_lock = threading.Lock()
         
     def embed_text(self, text: str) -> List[float]:
         """
         Generate embedding for a single text.
-        
+
         Args:
             text: Text to embed
-            
+
         Returns:
             List of floats representing the embedding
         """
+        if self.cache_path is not None:
+            key = self._cache_key(text)
+            with self._cache_lock:
+                self._load_cache()
+                if key in self._cache:
+                    return self._cache[key]
+            embedding = self._embed_uncached(text)
+            with self._cache_lock:
+                self._cache[key] = embedding
+                self._save_cache()
+            return embedding
+        return self._embed_uncached(text)
+
+    def _embed_uncached(self, text: str) -> List[float]:
+        """Embed a single text with a direct Ollama call."""
         try:
             response = self.client.embeddings(
                 model=self.model,
-                prompt=text
+                prompt=text,
+                keep_alive=self.keep_alive
             )
             return response['embedding']
         except Exception as e:
@@ -45,30 +94,93 @@ class EmbeddingGenerator:
     def embed_batch(self, texts: List[str], batch_size: int = 10) -> List[List[float]]:
         """
         Generate embeddings for multiple texts.
-        
+
         Args:
             texts: List of texts to embed
-            batch_size: Number of texts to process at once
-            
+            batch_size: Number of texts to send per request
+
         Returns:
             List of embeddings
         """
-        embeddings = []
-        
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            
+        if self.cache_path is None:
+            return self._embed_many(texts, batch_size)
+
+        # Only embed texts not already memoized on disk, then fill the
+        # results back in input order
+        keys = [self._cache_key(text) for text in texts]
+        with self._cache_lock:
+            self._load_cache()
+            missing = [i for i, key in enumerate(keys) if key not in self._cache]
+
+        if missing:
+            computed = self._embed_many([texts[i] for i in missing], batch_size)
+            with self._cache_lock:
+                for i, embedding in zip(missing, computed):
+                    self._cache[keys[i]] = embedding
+                self._save_cache()
+        if len(missing) < len(texts):
+            logger.info(f"Reused {len(texts) - len(missing)} cached embeddings")
+
+        return [self._cache[key] for key in keys]
+
+    def _embed_many(self, texts: List[str], batch_size: int) -> List[List[float]]:
+        """Embed texts via concurrent sub-batch requests, preserving order."""
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+
+        # Issue sub-batches concurrently; the HTTP calls release the GIL, so
+        # threads keep multiple requests in flight on the Ollama server.
+        # map() preserves input order
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = executor.map(self._embed_one_batch, batches)
+
+        embeddings = [embedding for batch_result in results for embedding in batch_result]
+
+        logger.info(f"Generated {len(embeddings)} embeddings")
+        return embeddings
+
+    def _cache_key(self, text: str) -> str:
+        """Cache key for a text under the current model."""
+        return hashlib.sha1((self.model + "\0" + text).encode("utf-8")).hexdigest()
+
+    def _load_cache(self):
+        """Load the on-disk embedding memo once (caller holds the lock)."""
+        if self._cache is not None:
+            return
+        self._cache = {}
+        if self.cache_path.exists():
+            try:
+                with open(self.cache_path, "rb") as f:
+                    self._cache = pickle.load(f)
+            except Exception as e:
+                logger.warning(f"Could not read embedding cache, starting fresh: {e}")
+
+    def _save_cache(self):
+        """Persist the embedding memo to disk (caller holds the lock)."""
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(".pkl.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(self._cache, f)
+        tmp_path.replace(self.cache_path)
+
+    def _embed_one_batch(self, batch: List[str]) -> List[List[float]]:
+        """Embed one sub-batch with a single request, falling back to per-text calls."""
+        try:
+            # Ollama's embed endpoint accepts a list of inputs, so the
+            # server batches inference instead of one request per text
+            response = self.client.embed(model=self.model, input=batch,
+                                         keep_alive=self.keep_alive)
+            return response['embeddings']
+        except Exception as e:
+            logger.error(f"Batch embedding failed, falling back to per-text calls: {e}")
+            embeddings = []
             for text in batch:
                 try:
-                    embedding = self.embed_text(text)
-                    embeddings.append(embedding)
+                    embeddings.append(self.embed_text(text))
                 except Exception as e:
                     logger.error(f"Failed to embed text: {e}")
                     # Add zero vector as placeholder
                     embeddings.append([0.0] * 768)
-        
-        logger.info(f"Generated {len(embeddings)} embeddings")
-        return embeddings
+            return embeddings
     
     def get_embedding_dimension(self) -> int:
         """Get the dimension of embeddings from this model."""
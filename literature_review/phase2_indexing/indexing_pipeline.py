@@ -2,6 +2,7 @@
 
 import logging
 from pathlib import Path
+from pymongo import UpdateOne
 from tqdm import tqdm
 import sys
 
@@ -11,7 +12,10 @@ from literature_review.config import config
 from literature_review.utils.mongodb_client import mongodb
 from literature_review.utils.fact_loader import FactLoader
 from literature_review.phase2_indexing.document_processor import DocumentChunker
-from literature_review.phase2_indexing.embedding_generator import EmbeddingGenerator
+from literature_review.phase2_indexing.embedding_generator import (
+    EmbeddingGenerator,
+    embedding_to_binary,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +23,7 @@ class IndexingPipeline:
     """Pipeline for chunking documents and generating embeddings."""
     
     def __init__(self):
+        config.ensure_dirs()
         self.mongodb = mongodb
         self.mongodb.connect()
         self.chunker = DocumentChunker(
@@ -27,104 +32,154 @@ class IndexingPipeline:
         )
         self.embedder = EmbeddingGenerator(
             model=config.EMBEDDING_MODEL,
-            base_url=config.OLLAMA_BASE_URL
+            base_url=config.OLLAMA_BASE_URL,
+            max_workers=config.MAX_WORKERS_EMBEDDING,
+            keep_alive=config.OLLAMA_KEEP_ALIVE
         )
         self.fact_loader = FactLoader()
     
-    def chunk_documents(self):
+    def chunk_documents(self, flush_size: int = 5000):
         """Chunk all documents in MongoDB."""
         logger.info("Starting document chunking...")
-        
+
         # Get all documents
         documents = list(self.mongodb.documents.find({"extraction_status": "success"}))
         logger.info(f"Found {len(documents)} documents to chunk")
-        
+
+        # Chunk counts for all documents in one aggregation instead of one
+        # count_documents round-trip per document
+        chunked = {
+            r["_id"]: r["n"]
+            for r in self.mongodb.chunks.aggregate([
+                {"$group": {"_id": "$doc_id", "n": {"$sum": 1}}}
+            ])
+        }
+
         total_chunks = 0
-        
+        pending = []
+
         with tqdm(total=len(documents), desc="Chunking documents") as pbar:
             for doc in documents:
                 # Check if already chunked
-                existing_chunks = self.mongodb.chunks.count_documents({"doc_id": doc["doc_id"]})
-                if existing_chunks > 0:
+                if chunked.get(doc["doc_id"], 0) > 0:
                     logger.debug(f"Skipping already chunked: {doc['filename']}")
                     pbar.update(1)
                     continue
-                
+
                 # Chunk document
                 chunks = self.chunker.chunk_document(doc)
-                
+
                 if chunks:
-                    # Store chunks without embeddings first
-                    self.mongodb.chunks.insert_many(chunks)
+                    # Store chunks without embeddings first, inserted in
+                    # batches spanning multiple documents
+                    pending.extend(chunks)
                     total_chunks += len(chunks)
                     logger.info(f"  {doc['filename']}: {len(chunks)} chunks")
-                
+
+                    if len(pending) >= flush_size:
+                        self.mongodb.chunks.insert_many(pending)
+                        pending = []
+
                 pbar.update(1)
-        
+
+        if pending:
+            self.mongodb.chunks.insert_many(pending)
+
         logger.info(f"Chunking complete: {total_chunks} total chunks created")
     
     def generate_chunk_embeddings(self, batch_size: int = 50):
         """Generate embeddings for all chunks."""
         logger.info("Generating embeddings for chunks...")
-        
-        # Get chunks without embeddings
-        chunks_without_embeddings = list(self.mongodb.chunks.find({"embedding": {"$exists": False}}))
-        
-        if not chunks_without_embeddings:
+
+        # The needs_embedding flag is backed by a partial index, so this query
+        # is an index probe instead of a collection scan
+        query = {"needs_embedding": True}
+
+        # Count first (cheap), then stream the cursor so chunk text is never
+        # all in memory at once
+        total = self.mongodb.chunks.count_documents(query)
+
+        if total == 0:
             logger.info("All chunks already have embeddings")
             return
-        
-        logger.info(f"Found {len(chunks_without_embeddings)} chunks needing embeddings")
-        
-        with tqdm(total=len(chunks_without_embeddings), desc="Embedding chunks") as pbar:
-            for i in range(0, len(chunks_without_embeddings), batch_size):
-                batch = chunks_without_embeddings[i:i + batch_size]
-                texts = [chunk["text"] for chunk in batch]
-                
-                # Generate embeddings
-                embeddings = self.embedder.embed_batch(texts, batch_size=10)
-                
-                # Update chunks in MongoDB
-                for chunk, embedding in zip(batch, embeddings):
-                    self.mongodb.chunks.update_one(
-                        {"_id": chunk["_id"]},
-                        {"$set": {"embedding": embedding}}
-                    )
-                
+
+        logger.info(f"Found {total} chunks needing embeddings")
+
+        cursor = self.mongodb.chunks.find(
+            query, projection={"_id": 1, "text": 1}
+        ).batch_size(batch_size)
+
+        def _flush(batch):
+            texts = [chunk["text"] for chunk in batch]
+
+            # Generate embeddings (one request for the whole batch)
+            embeddings = self.embedder.embed_batch(texts, batch_size=batch_size)
+
+            # Update chunks in MongoDB in a single bulk write; embeddings are
+            # stored as raw float32 bytes (~4x smaller than BSON double arrays)
+            ops = [
+                UpdateOne({"_id": chunk["_id"]},
+                          {"$set": {"embedding_f32": embedding_to_binary(embedding)},
+                           "$unset": {"needs_embedding": ""}})
+                for chunk, embedding in zip(batch, embeddings)
+            ]
+            self.mongodb.chunks.bulk_write(ops, ordered=False)
+
+        with tqdm(total=total, desc="Embedding chunks") as pbar:
+            batch = []
+            for chunk in cursor:
+                batch.append(chunk)
+                if len(batch) >= batch_size:
+                    _flush(batch)
+                    pbar.update(len(batch))
+                    batch = []
+
+            if batch:
+                _flush(batch)
                 pbar.update(len(batch))
-        
+
         logger.info("Chunk embeddings complete")
     
     def index_facts(self):
         """Load facts and generate embeddings."""
         logger.info("Indexing stylized facts...")
-        
+
         # Load facts
         facts = self.fact_loader.load_all_facts()
-        
-        logger.info(f"Generating embeddings for {len(facts)} facts...")
-        
-        with tqdm(total=len(facts), desc="Embedding facts") as pbar:
-            for fact in facts:
-                # Check if already indexed
-                existing = self.mongodb.facts.find_one({"fact_number": fact["fact_number"]})
-                if existing and "embedding" in existing:
-                    pbar.update(1)
-                    continue
-                
-                # Generate embedding
-                embedding = self.embedder.embed_text(fact["fact_text"])
-                fact["embedding"] = embedding
-                
-                # Upsert to MongoDB
-                self.mongodb.facts.update_one(
-                    {"fact_number": fact["fact_number"]},
-                    {"$set": fact},
-                    upsert=True
-                )
-                
-                pbar.update(1)
-        
+
+        # Build the skip set with a single query (same trick as the PDF dedup)
+        indexed = {
+            doc["fact_number"]
+            for doc in self.mongodb.facts.find(
+                {"fact_number": {"$in": [f["fact_number"] for f in facts]},
+                 "embedding": {"$exists": True}},
+                projection={"fact_number": 1}
+            )
+        }
+        pending = [f for f in facts if f["fact_number"] not in indexed]
+
+        if not pending:
+            logger.info("All facts already indexed")
+            return
+
+        logger.info(f"Generating embeddings for {len(pending)} facts "
+                    f"({len(indexed)} already indexed)...")
+
+        # One batched call for all pending facts
+        embeddings = self.embedder.embed_batch([f["fact_text"] for f in pending])
+
+        # Upsert everything in a single bulk write
+        ops = []
+        for fact, embedding in zip(pending, embeddings):
+            fact["embedding"] = embedding
+            ops.append(UpdateOne(
+                {"fact_number": fact["fact_number"]},
+                {"$set": fact},
+                upsert=True
+            ))
+
+        self.mongodb.facts.bulk_write(ops, ordered=False)
+
         logger.info("Fact indexing complete")
     
     def run(self):
@@ -47,23 +47,31 @@ class AssessmentAgent:
         self.retriever = RAGRetriever()
         self.llm = OllamaClient()
     
-    def assess_fact(self, fact: Dict) -> Dict:
+    def assess_fact(self, fact: Dict, fact_embedding: List[float] = None,
+                    relevant_chunks: List[Dict] = None) -> Dict:
         """
         Assess a single stylized fact.
-        
+
         Args:
             fact: Dictionary containing fact information
-            
+            fact_embedding: Optional precomputed embedding of the fact text
+            relevant_chunks: Optional pre-retrieved chunks (lets the pipeline
+                prefetch retrievals while the LLM is busy)
+
         Returns:
             Assessment result dictionary
         """
         fact_number = fact["fact_number"]
         fact_text = fact["fact_text"]
-        
+
         logger.info(f"Assessing fact #{fact_number}: {fact_text[:100]}...")
-        
-        # Step 1: Retrieve relevant chunks
-        relevant_chunks = self.retriever.retrieve(fact_text)
+
+        # Step 1: Retrieve relevant chunks (unless already prefetched)
+        if relevant_chunks is None:
+            if fact_embedding is not None:
+                relevant_chunks = self.retriever.retrieve_with_vec(fact_embedding)
+            else:
+                relevant_chunks = self.retriever.retrieve(fact_text)
         
         if not relevant_chunks:
             logger.warning(f"No relevant chunks found for fact #{fact_number}")
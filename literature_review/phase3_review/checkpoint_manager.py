@@ -2,6 +2,7 @@
 
 import json
 import logging
+import os
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Optional
@@ -11,41 +12,91 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from literature_review.config import config
 
+# orjson serializes/parses a few times faster than the stdlib; fall back
+# to json when it is not installed
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 class CheckpointManager:
-    """Manage checkpoints for resumable fact processing."""
-    
-    def __init__(self, checkpoint_path: Path = None):
+    """Manage checkpoints for resumable fact processing.
+
+    Per-fact progress goes to an append-only write-ahead log (one JSON line
+    per fact); the full checkpoint is snapshotted every `snapshot_every`
+    facts instead of being rewritten after each one. On load, the snapshot
+    is read and the WAL replayed on top of it.
+    """
+
+    def __init__(self, checkpoint_path: Path = None, snapshot_every: int = 25):
         self.checkpoint_path = checkpoint_path or config.CHECKPOINT_DIR / "review_checkpoint.json"
+        self.wal_path = self.checkpoint_path.with_suffix(".wal")
+        self.snapshot_every = snapshot_every
+        self._updates_since_snapshot = 0
         self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
-    
+
     def load_checkpoint(self) -> Optional[Dict]:
-        """Load checkpoint from file."""
-        if not self.checkpoint_path.exists():
+        """Load checkpoint from snapshot plus any trailing WAL entries."""
+        checkpoint = None
+
+        if self.checkpoint_path.exists():
+            try:
+                with open(self.checkpoint_path, 'rb') as f:
+                    checkpoint = _loads(f.read())
+            except Exception as e:
+                logger.error(f"Error loading checkpoint: {e}")
+
+        entries = self._read_wal()
+        if entries:
+            if checkpoint is None:
+                checkpoint = {
+                    "last_completed_fact": 0,
+                    "total_facts": 0,
+                    "facts_processed": 0,
+                    "failed_facts": []
+                }
+            for entry in entries:
+                self._apply(checkpoint, entry["n"], entry["ok"])
+
+        if checkpoint is None:
             logger.info("No checkpoint found, starting from beginning")
             return None
-        
-        try:
-            with open(self.checkpoint_path, 'r') as f:
-                checkpoint = json.load(f)
-            logger.info(f"Loaded checkpoint: last completed fact #{checkpoint.get('last_completed_fact', 0)}")
-            return checkpoint
-        except Exception as e:
-            logger.error(f"Error loading checkpoint: {e}")
-            return None
-    
+
+        logger.info(f"Loaded checkpoint: last completed fact "
+                    f"#{checkpoint.get('last_completed_fact', 0)} "
+                    f"({len(entries)} WAL entries replayed)")
+        return checkpoint
+
     def save_checkpoint(self, checkpoint: Dict):
-        """Save checkpoint to file."""
+        """Snapshot the full checkpoint and reset the WAL."""
         checkpoint["last_updated"] = datetime.now().isoformat()
-        
+
         try:
-            with open(self.checkpoint_path, 'w') as f:
-                json.dump(checkpoint, f, indent=2)
+            # Write-then-rename so a crash mid-write never leaves a
+            # truncated snapshot behind
+            tmp_path = self.checkpoint_path.with_suffix(".json.tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps(checkpoint))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.checkpoint_path)
+            # Entries up to here are covered by the snapshot
+            open(self.wal_path, 'w').close()
+            self._updates_since_snapshot = 0
             logger.debug(f"Checkpoint saved: fact #{checkpoint.get('last_completed_fact', 0)}")
         except Exception as e:
             logger.error(f"Error saving checkpoint: {e}")
-    
+
     def create_initial_checkpoint(self, total_facts: int) -> Dict:
         """Create initial checkpoint."""
         return {
@@ -56,15 +107,48 @@ class CheckpointManager:
             "started_at": datetime.now().isoformat(),
             "last_updated": datetime.now().isoformat()
         }
-    
+
     def update_checkpoint(self, checkpoint: Dict, fact_number: int, success: bool = True):
-        """Update checkpoint after processing a fact."""
+        """Update checkpoint after processing a fact (WAL append, not rewrite)."""
+        self._apply(checkpoint, fact_number, success)
+
+        try:
+            with open(self.wal_path, 'ab') as f:
+                f.write(_dumps({"n": fact_number, "ok": success}) + b"\n")
+        except Exception as e:
+            logger.error(f"Error appending to checkpoint WAL: {e}")
+
+        self._updates_since_snapshot += 1
+        if self._updates_since_snapshot >= self.snapshot_every:
+            self.save_checkpoint(checkpoint)
+
+    def _apply(self, checkpoint: Dict, fact_number: int, success: bool):
+        """Apply one fact result to the in-memory checkpoint."""
         checkpoint["last_completed_fact"] = fact_number
-        checkpoint["facts_processed"] += 1
-        
+        checkpoint["facts_processed"] = checkpoint.get("facts_processed", 0) + 1
+
         if not success:
             if "failed_facts" not in checkpoint:
                 checkpoint["failed_facts"] = []
             checkpoint["failed_facts"].append(fact_number)
-        
-        self.save_checkpoint(checkpoint)
+
+    def _read_wal(self) -> list:
+        """Read all WAL entries, skipping any torn trailing line."""
+        if not self.wal_path.exists():
+            return []
+
+        entries = []
+        try:
+            with open(self.wal_path, 'rb') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entries.append(_loads(line))
+                    except ValueError:
+                        logger.warning("Skipping torn WAL entry")
+        except Exception as e:
+            logger.error(f"Error reading checkpoint WAL: {e}")
+
+        return entries
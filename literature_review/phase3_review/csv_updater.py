@@ -1,9 +1,10 @@
 """CSV updater to add assessment results to CSV files."""
 
-import pandas as pd
+import csv
 import logging
+import time
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List
 from datetime import datetime
 import sys
 
@@ -13,87 +14,127 @@ from literature_review.config import config
 
 logger = logging.getLogger(__name__)
 
+REQUIRED_COLUMNS = [
+    "Literature Support Score (1-100)",
+    "Number of Papers Reviewed",
+    "Supporting Papers",
+    "Key Evidence Summary",
+    "Assessment Confidence",
+    "Last Updated"
+]
+
 class CSVUpdater:
-    """Update CSV files with assessment results."""
-    
+    """Update CSV files with assessment results.
+
+    Each CSV is read once at startup; updates mutate the in-memory rows
+    and dirty files are written back in flush(), so a full review run does
+    one write per file instead of a read+write per fact. These files are a
+    few hundred rows each, so they are held as plain row lists via the csv
+    module rather than pandas frames.
+    """
+
     def __init__(self, csv_dir: Path = None):
         self.csv_dir = csv_dir or config.CSV_DIR
-    
+        self.headers = {}       # path -> header row
+        self.rows = {}          # path -> list of data rows
+        self.fact_index = {}    # fact_number -> (path, row position)
+        self._col_pos = {}      # path -> {column name: column position}
+        self._dirty = set()
+        self._ts_cache = (0, "")
+        self._load_files()
+
+    def _load_files(self):
+        """Read every CSV once and index fact numbers to their rows."""
+        for csv_file in sorted(self.csv_dir.glob("*.csv")):
+            try:
+                with open(csv_file, newline='', encoding='utf-8') as f:
+                    reader = csv.reader(f)
+                    header = next(reader, None)
+                    if header is None:
+                        continue
+                    rows = list(reader)
+            except Exception as e:
+                logger.debug(f"Error reading {csv_file.name}: {e}")
+                continue
+
+            self._ensure_columns(header, rows)
+            self.headers[csv_file] = header
+            self.rows[csv_file] = rows
+            col = {name: pos for pos, name in enumerate(header)}
+            self._col_pos[csv_file] = col
+
+            num_pos = col.get("Number")
+            if num_pos is None:
+                continue
+            for idx, row in enumerate(rows):
+                try:
+                    self.fact_index[int(row[num_pos])] = (csv_file, idx)
+                except (ValueError, IndexError):
+                    continue
+
+        logger.info(f"Loaded {len(self.rows)} CSV files "
+                    f"({len(self.fact_index)} facts indexed)")
+
     def update_fact(self, fact_number: int, assessment: Dict):
         """
-        Update CSV with assessment results for a fact.
-        
+        Update the in-memory CSV rows with assessment results for a fact.
+
         Args:
             fact_number: Fact number
             assessment: Assessment results dictionary
         """
-        # Find which CSV file contains this fact
-        csv_file = self._find_csv_for_fact(fact_number)
-        
-        if not csv_file:
+        location = self.fact_index.get(fact_number)
+
+        if location is None:
             logger.error(f"Could not find CSV file for fact #{fact_number}")
             return
-        
+
+        csv_file, idx = location
+        row = self.rows[csv_file][idx]
+        col = self._col_pos[csv_file]
+
         try:
-            # Read CSV
-            df = pd.read_csv(csv_file)
-            
-            # Ensure assessment columns exist
-            self._ensure_columns(df)
-            
-            # Find fact row
-            fact_idx = df[df["Number"] == fact_number].index
-            
-            if len(fact_idx) == 0:
-                logger.error(f"Fact #{fact_number} not found in {csv_file.name}")
-                return
-            
-            idx = fact_idx[0]
-            
-            # Update columns
-            df.at[idx, "Literature Support Score (1-100)"] = assessment.get("score", 0)
-            df.at[idx, "Number of Papers Reviewed"] = assessment.get("retrieved_chunks_count", 0)
-            df.at[idx, "Supporting Papers"] = ", ".join(assessment.get("supporting_papers", []))
-            df.at[idx, "Key Evidence Summary"] = assessment.get("key_evidence", "")
-            df.at[idx, "Assessment Confidence"] = assessment.get("confidence", "low")
-            df.at[idx, "Last Updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
-            # Save CSV
-            df.to_csv(csv_file, index=False)
+            row[col["Literature Support Score (1-100)"]] = assessment.get("score", 0)
+            row[col["Number of Papers Reviewed"]] = assessment.get("retrieved_chunks_count", 0)
+            row[col["Supporting Papers"]] = ", ".join(assessment.get("supporting_papers", []))
+            row[col["Key Evidence Summary"]] = assessment.get("key_evidence", "")
+            row[col["Assessment Confidence"]] = assessment.get("confidence", "low")
+            row[col["Last Updated"]] = self._now()
+
+            self._dirty.add(csv_file)
             logger.debug(f"Updated {csv_file.name} with fact #{fact_number} results")
-            
+
         except Exception as e:
             logger.error(f"Error updating CSV for fact #{fact_number}: {e}")
-    
-    def _find_csv_for_fact(self, fact_number: int) -> Path:
-        """Find which CSV file contains a fact number."""
-        # Fact number ranges for each CSV (100 facts per file)
-        csv_files = sorted(self.csv_dir.glob("*.csv"))
-        
-        for csv_file in csv_files:
-            if csv_file.name == "README.md":
-                continue
-            
+
+    def flush(self):
+        """Write all files modified since the last flush back to disk."""
+        for csv_file in self._dirty:
             try:
-                df = pd.read_csv(csv_file)
-                if fact_number in df["Number"].values:
-                    return csv_file
+                with open(csv_file, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.writer(f)
+                    writer.writerow(self.headers[csv_file])
+                    writer.writerows(self.rows[csv_file])
+                logger.debug(f"Flushed {csv_file.name}")
             except Exception as e:
-                logger.debug(f"Error reading {csv_file.name}: {e}")
-        
-        return None
-    
-    def _ensure_columns(self, df: pd.DataFrame):
-        """Ensure required assessment columns exist."""
-        required_columns = [
-            "Literature Support Score (1-100)",
-            "Number of Papers Reviewed",
-            "Supporting Papers",
-            "Key Evidence Summary",
-            "Assessment Confidence",
-            "Last Updated"
-        ]
-        
-        for col in required_columns:
-            if col not in df.columns:
-                df[col] = ""
+                logger.error(f"Error writing {csv_file.name}: {e}")
+
+        self._dirty.clear()
+
+    def _now(self) -> str:
+        """Current timestamp string, reformatted at most once per second."""
+        t = int(time.time())
+        if t != self._ts_cache[0]:
+            self._ts_cache = (t, datetime.fromtimestamp(t).strftime("%Y-%m-%d %H:%M:%S"))
+        return self._ts_cache[1]
+
+    def _ensure_columns(self, header: List[str], rows: List[List[str]]):
+        """Ensure required assessment columns exist, padding rows to match."""
+        for name in REQUIRED_COLUMNS:
+            if name not in header:
+                header.append(name)
+
+        width = len(header)
+        for row in rows:
+            if len(row) < width:
+                row.extend([""] * (width - len(row)))
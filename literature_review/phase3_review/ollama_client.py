@@ -3,31 +3,48 @@
 import logging
 import ollama
 import json
-from typing import Dict
+import re
+from typing import Dict, Optional
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from literature_review.config import config
+from literature_review.phase2_indexing.embedding_generator import get_client
 
 logger = logging.getLogger(__name__)
 
+# Captures the JSON object from a response, whether or not the model wrapped
+# it in a markdown code fence
+JSON_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```|(\{.*\})", re.S)
+
 class OllamaClient:
-    """Client for interacting with Ollama LLM."""
-    
-    def __init__(self):
-        self.client = ollama.Client(host=config.OLLAMA_BASE_URL)
-        self.model = config.LLM_MODEL
+    """Client for interacting with Ollama LLM.
+
+    Singleton (like MongoDBClient): every component talks to the server
+    through one underlying HTTP session, so connections stay warm across
+    facts instead of each caller opening its own.
+    """
+
+    _instance: Optional['OllamaClient'] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance.client = get_client(config.OLLAMA_BASE_URL)
+            cls._instance.model = config.LLM_MODEL
+        return cls._instance
     
-    def generate(self, prompt: str, system_prompt: str = None) -> str:
+    def generate(self, prompt: str, system_prompt: str = None, format: str = None) -> str:
         """
         Generate response from LLM.
-        
+
         Args:
             prompt: User prompt
             system_prompt: Optional system prompt
-            
+            format: Optional output constraint ("json" or a JSON schema dict)
+
         Returns:
             Generated text response
         """
@@ -45,9 +62,14 @@ class OllamaClient:
                 "content": prompt
             })
             
+            # keep_alive avoids a cold model reload between facts; the
+            # system prompt is static, so the server can also reuse its
+            # prompt-prefix KV cache across calls
             response = self.client.chat(
                 model=self.model,
                 messages=messages,
+                format=format,
+                keep_alive=config.OLLAMA_KEEP_ALIVE,
                 options={
                     "temperature": config.LLM_TEMPERATURE,
                     "top_p": config.LLM_TOP_P,
@@ -76,21 +98,18 @@ class OllamaClient:
         """
         for attempt in range(max_retries):
             try:
-                response_text = self.generate(prompt, system_prompt)
-                
-                # Try to extract JSON from response
-                # Sometimes LLM adds markdown code blocks
-                if "```json" in response_text:
-                    start = response_text.find("```json") + 7
-                    end = response_text.find("```", start)
-                    json_text = response_text[start:end].strip()
-                elif "```" in response_text:
-                    start = response_text.find("```") + 3
-                    end = response_text.find("```", start)
-                    json_text = response_text[start:end].strip()
+                # Constrain sampling to JSON grammar; parse failures (and
+                # therefore expensive retries) become rare
+                response_text = self.generate(prompt, system_prompt, format="json")
+
+                # Extract the JSON object in one regex pass; the model
+                # sometimes wraps it in markdown code blocks
+                match = JSON_RE.search(response_text)
+                if match:
+                    json_text = match.group(1) or match.group(2)
                 else:
                     json_text = response_text.strip()
-                
+
                 # Parse JSON
                 result = json.loads(json_text)
                 return result
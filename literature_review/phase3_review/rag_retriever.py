@@ -1,6 +1,8 @@
 """RAG Retriever for finding relevant document chunks."""
 
 import logging
+import threading
+import numpy as np
 from typing import List, Dict
 import sys
 from pathlib import Path
@@ -9,10 +11,57 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from literature_review.config import config
 from literature_review.utils.mongodb_client import mongodb
-from literature_review.phase2_indexing.embedding_generator import EmbeddingGenerator
+from literature_review.phase2_indexing.embedding_generator import (
+    EmbeddingGenerator,
+    binary_to_embedding,
+)
 
 logger = logging.getLogger(__name__)
 
+def load_chunk_vectors(chunks_collection, include_text: bool = True):
+    """
+    Load all chunk embeddings and their metadata from MongoDB.
+
+    Shared between the retriever's in-memory search and the offline FAISS
+    index builder. With include_text=False only the (doc_id, chunk_id)
+    identifiers ride along, so the ranking pass does not pull every chunk's
+    text over the wire.
+
+    Args:
+        chunks_collection: MongoDB chunks collection
+        include_text: Whether to fetch text and metadata per chunk
+
+    Returns:
+        Tuple of (list of float32 vectors, list of metadata dicts)
+    """
+    projection = {"embedding_f32": 1, "embedding": 1, "doc_id": 1, "chunk_id": 1}
+    if include_text:
+        projection.update({"text": 1, "metadata": 1})
+
+    # Get all chunks with embeddings (either storage layout)
+    cursor = chunks_collection.find(
+        {"$or": [
+            {"embedding_f32": {"$exists": True}},
+            {"embedding": {"$exists": True}}
+        ]},
+        projection
+    )
+
+    vectors = []
+    meta = []
+    for chunk in cursor:
+        if "embedding_f32" in chunk:
+            vectors.append(binary_to_embedding(chunk["embedding_f32"]))
+        else:
+            vectors.append(np.asarray(chunk["embedding"], dtype=np.float32))
+        entry = {"doc_id": chunk["doc_id"], "chunk_id": chunk["chunk_id"]}
+        if include_text:
+            entry["text"] = chunk["text"]
+            entry["metadata"] = chunk.get("metadata", {})
+        meta.append(entry)
+
+    return vectors, meta
+
 class RAGRetriever:
     """Retrieve relevant document chunks using vector similarity."""
     
@@ -21,8 +70,26 @@ class RAGRetriever:
         self.mongodb.connect()
         self.embedder = EmbeddingGenerator(
             model=config.EMBEDDING_MODEL,
-            base_url=config.OLLAMA_BASE_URL
+            base_url=config.OLLAMA_BASE_URL,
+            keep_alive=config.OLLAMA_KEEP_ALIVE,
+            # Fact texts recur across resumed runs, so memoize their
+            # embeddings on disk
+            cache_path=config.EMBEDDING_CACHE_PATH
         )
+        # Normalized chunk-embedding matrix and per-row metadata, loaded
+        # lazily on the first retrieval and reused for every fact. When
+        # quantization is enabled the matrix is held as int8 with per-row
+        # scales instead of float32
+        self._matrix = None
+        self._row_scales = None
+        self._meta = None
+        self._matrix_lock = threading.Lock()
+        self._quantize = config.QUANTIZE_EMBEDDINGS
+        self._use_atlas = config.USE_ATLAS_VECTOR_SEARCH
+        # Offline FAISS index (optional); loaded on the first retrieval
+        self._faiss_index = None
+        self._faiss_meta = None
+        self._faiss_checked = False
     
     def retrieve(self, fact_text: str, top_k: int = None) -> List[Dict]:
         """
@@ -35,65 +102,348 @@ class RAGRetriever:
         Returns:
             List of relevant chunks with similarity scores
         """
-        if top_k is None:
-            top_k = config.TOP_K_RETRIEVAL
-        
         # Generate embedding for query
         query_embedding = self.embedder.embed_text(fact_text)
-        
-        # Vector similarity search using cosine similarity
-        # Note: This is a basic implementation. MongoDB Atlas Vector Search would be more efficient
-        relevant_chunks = self._cosine_similarity_search(query_embedding, top_k)
-        
+
+        return self.retrieve_with_vec(query_embedding, top_k)
+
+    def retrieve_with_vec(self, query_embedding: List[float], top_k: int = None) -> List[Dict]:
+        """
+        Retrieve most relevant chunks for a precomputed query embedding.
+
+        Lets callers batch-embed many facts up front instead of one
+        embedding request per retrieval.
+
+        Args:
+            query_embedding: Embedding of the query text
+            top_k: Number of chunks to retrieve (default from config)
+
+        Returns:
+            List of relevant chunks with similarity scores
+        """
+        if top_k is None:
+            top_k = config.TOP_K_RETRIEVAL
+
+        # Prefer server-side vector search (Atlas HNSW index); fall back to
+        # the in-memory cosine search on self-hosted MongoDB
+        relevant_chunks = None
+        if self._use_atlas:
+            try:
+                relevant_chunks = self._atlas_vector_search(query_embedding, top_k)
+            except Exception as e:
+                logger.warning(f"$vectorSearch unavailable, using in-memory search: {e}")
+                self._use_atlas = False
+            if not relevant_chunks:
+                # An empty result from a non-empty corpus means the Atlas
+                # index does not cover the data (e.g. wrong path); falling
+                # through silently would score every fact as unsupported
+                logger.warning("$vectorSearch returned no results, "
+                               "using in-memory search")
+                self._use_atlas = False
+                relevant_chunks = None
+
+        if relevant_chunks is None and self._load_faiss():
+            relevant_chunks = self._faiss_search(query_embedding, top_k)
+
+        if relevant_chunks is None:
+            relevant_chunks = self._cosine_similarity_search(query_embedding, top_k)
+
         logger.info(f"Retrieved {len(relevant_chunks)} chunks for fact")
-        
+
         return relevant_chunks
-    
-    def _cosine_similarity_search(self, query_embedding: List[float], top_k: int) -> List[Dict]:
+
+    def _load_faiss(self) -> bool:
+        """Load the offline FAISS index if faiss is installed and one was built."""
+        if self._faiss_index is not None:
+            return True
+        if self._faiss_checked:
+            return False
+        self._faiss_checked = True
+
+        if not config.FAISS_INDEX_PATH.exists():
+            return False
+
+        try:
+            import faiss
+            import pickle
+
+            self._faiss_index = faiss.read_index(str(config.FAISS_INDEX_PATH),
+                                                 faiss.IO_FLAG_MMAP)
+            with open(config.FAISS_META_PATH, 'rb') as f:
+                self._faiss_meta = pickle.load(f)
+            logger.info(f"Loaded FAISS index with {self._faiss_index.ntotal} chunks")
+            return True
+        except Exception as e:
+            logger.warning(f"Could not load FAISS index, using in-memory search: {e}")
+            self._faiss_index = None
+            return False
+
+    def _faiss_search(self, query_embedding: List[float], top_k: int) -> List[Dict]:
         """
-        Perform cosine similarity search (basic implementation).
-        
+        Search the offline FAISS HNSW index.
+
         Args:
             query_embedding: Query vector
             top_k: Number of results
-            
+
         Returns:
             List of chunks with similarity scores
         """
-        import numpy as np
-        
-        # Get all chunks with embeddings
-        chunks = list(self.mongodb.chunks.find({"embedding": {"$exists": True}}))
-        
-        if not chunks:
-            logger.warning("No chunks with embeddings found!")
-            return []
-        
-        # Calculate cosine similarity
-        query_vec = np.array(query_embedding)
-        query_norm = np.linalg.norm(query_vec)
-        
-        similarities = []
-        for chunk in chunks:
-            chunk_vec = np.array(chunk["embedding"])
-            chunk_norm = np.linalg.norm(chunk_vec)
-            
-            if chunk_norm > 0 and query_norm > 0:
-                similarity = np.dot(query_vec, chunk_vec) / (query_norm * chunk_norm)
-                similarities.append((chunk, float(similarity)))
-        
-        # Sort by similarity (descending)
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        
-        # Return top-k
+        query = np.asarray(query_embedding, dtype=np.float32).reshape(1, -1)
+        query_norm = np.linalg.norm(query)
+        if query_norm > 0:
+            query /= query_norm
+
+        scores, indices = self._faiss_index.search(query, top_k)
+
         results = []
-        for chunk, score in similarities[:top_k]:
+        for score, i in zip(scores[0], indices[0]):
+            if i < 0:
+                continue
+            chunk = self._faiss_meta[i]
+            results.append({
+                "doc_id": chunk["doc_id"],
+                "chunk_id": chunk["chunk_id"],
+                "text": chunk["text"],
+                "metadata": chunk["metadata"],
+                "similarity_score": float(score)
+            })
+
+        return results
+
+    def _atlas_vector_search(self, query_embedding: List[float], top_k: int) -> List[Dict]:
+        """
+        Run the similarity search inside MongoDB with $vectorSearch.
+
+        The database walks its HNSW index in C++ and returns only the top-k
+        documents, instead of shipping every embedding to Python.
+
+        Args:
+            query_embedding: Query vector
+            top_k: Number of results
+
+        Returns:
+            List of chunks with similarity scores
+        """
+        pipeline = [
+            {"$vectorSearch": {
+                "index": config.VECTOR_INDEX_NAME,
+                # Phase 2 stores embeddings as packed float32 binData in
+                # embedding_f32; Atlas vector indexes support binData
+                # vectors, so the index must be defined on this path
+                "path": "embedding_f32",
+                "queryVector": list(query_embedding),
+                "numCandidates": max(config.NUM_CANDIDATES, top_k * 10),
+                "limit": top_k
+            }},
+            {"$project": {
+                "doc_id": 1,
+                "chunk_id": 1,
+                "text": 1,
+                "metadata": 1,
+                "similarity_score": {"$meta": "vectorSearchScore"}
+            }}
+        ]
+
+        results = []
+        for chunk in self.mongodb.chunks.aggregate(pipeline):
             results.append({
                 "doc_id": chunk["doc_id"],
                 "chunk_id": chunk["chunk_id"],
                 "text": chunk["text"],
                 "metadata": chunk.get("metadata", {}),
+                "similarity_score": float(chunk["similarity_score"])
+            })
+
+        return results
+    
+    def _read_arrow_cache(self):
+        """Load chunk vectors and metadata from the Arrow cache, if possible."""
+        if not config.CHUNK_CACHE_PATH.exists():
+            return None
+
+        try:
+            import pyarrow as pa
+
+            with pa.memory_map(str(config.CHUNK_CACHE_PATH)) as source:
+                table = pa.ipc.open_file(source).read_all()
+
+            emb = table.column("embedding").combine_chunks()
+            matrix = emb.values.to_numpy(zero_copy_only=False).reshape(len(table), -1)
+
+            meta = [
+                {"doc_id": d, "chunk_id": c}
+                for d, c in zip(table.column("doc_id").to_pylist(),
+                                table.column("chunk_id").to_pylist())
+            ]
+            logger.info(f"Loaded {len(meta)} chunks from Arrow cache")
+            return matrix.astype(np.float32, copy=False), meta
+        except Exception as e:
+            logger.warning(f"Could not read Arrow cache, falling back to MongoDB: {e}")
+            return None
+
+    def _write_arrow_cache(self, vectors, meta):
+        """Persist chunk vectors and metadata columnar, for fast future loads."""
+        try:
+            import pyarrow as pa
+        except ImportError:
+            return
+
+        try:
+            matrix = np.vstack(vectors).astype(np.float32)
+            dim = matrix.shape[1]
+            embedding = pa.FixedSizeListArray.from_arrays(
+                pa.array(matrix.ravel(), type=pa.float32()), dim
+            )
+            table = pa.table({
+                "doc_id": [m["doc_id"] for m in meta],
+                "chunk_id": [m["chunk_id"] for m in meta],
+                "embedding": embedding
+            })
+
+            config.CHUNK_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so readers never see a half-written cache
+            tmp_path = config.CHUNK_CACHE_PATH.with_suffix(".arrow.tmp")
+            with pa.OSFile(str(tmp_path), 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            tmp_path.replace(config.CHUNK_CACHE_PATH)
+            logger.info(f"Wrote Arrow chunk cache: {config.CHUNK_CACHE_PATH}")
+        except Exception as e:
+            logger.warning(f"Could not write Arrow cache: {e}")
+
+    def _load_matrix(self):
+        """Load all chunk embeddings into one row-normalized float32 matrix."""
+        if self._matrix is not None:
+            return
+
+        # Prefetched retrievals run on a pool, so two threads can reach a
+        # cold matrix at once; the lock makes sure it is loaded (and the
+        # Arrow cache written) exactly once
+        with self._matrix_lock:
+            if self._matrix is not None:
+                return
+
+            cached = self._read_arrow_cache()
+            if cached is not None:
+                matrix, meta = cached
+                self._finish_matrix(matrix, meta)
+                return
+
+            vectors, meta = load_chunk_vectors(self.mongodb.chunks, include_text=False)
+
+            if not vectors:
+                logger.warning("No chunks with embeddings found!")
+                self._meta = []
+                self._matrix = np.empty((0, 0), dtype=np.float32)
+                return
+
+            self._write_arrow_cache(vectors, meta)
+            self._finish_matrix(np.vstack(vectors), meta)
+
+    def _finish_matrix(self, matrix, meta):
+        """Normalize (and optionally quantize) the stacked embedding matrix."""
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix = matrix / norms
+
+        # Publish _matrix last: threads that pass the unlocked fast-path
+        # check in _load_matrix must find _meta already in place
+        self._meta = meta
+        if self._quantize:
+            # Symmetric per-row int8 quantization: 4x smaller resident matrix
+            # at a negligible cost in ranking fidelity
+            scales = np.max(np.abs(matrix), axis=1) / 127.0
+            scales[scales == 0] = 1.0
+            self._row_scales = scales.astype(np.float32)
+            self._matrix = np.round(matrix / scales[:, None]).astype(np.int8)
+        else:
+            self._matrix = matrix
+
+        logger.info(f"Loaded {len(meta)} chunk embeddings into memory "
+                    f"({'int8' if self._quantize else 'float32'})")
+
+    def _cosine_similarity_search(self, query_embedding: List[float], top_k: int) -> List[Dict]:
+        """
+        Perform cosine similarity search over the cached embedding matrix.
+
+        One matrix-vector product scores every chunk at once instead of a
+        Python loop of per-chunk dot products.
+
+        Args:
+            query_embedding: Query vector
+            top_k: Number of results
+
+        Returns:
+            List of chunks with similarity scores
+        """
+        self._load_matrix()
+
+        if not self._meta:
+            return []
+
+        query_vec = np.asarray(query_embedding, dtype=np.float32)
+        query_norm = np.linalg.norm(query_vec)
+        if query_norm > 0:
+            query_vec = query_vec / query_norm
+
+        if self._quantize:
+            # Quantize the query symmetrically and accumulate in int32
+            # (int16 would overflow: 768 products of up to 127*127)
+            q_scale = float(np.max(np.abs(query_vec))) / 127.0 or 1.0
+            q_int = np.round(query_vec / q_scale).astype(np.int32)
+            scores = (self._matrix @ q_int).astype(np.float32)
+            scores *= self._row_scales * q_scale
+        else:
+            scores = self._matrix @ query_vec
+
+        # Top-k by partial selection, then sort just those k
+        top_k = min(top_k, len(scores))
+        idx = np.argpartition(-scores, top_k - 1)[:top_k]
+        idx = idx[np.argsort(-scores[idx])]
+
+        # The in-memory matrix only carries ids; fetch text and metadata
+        # for just the winners
+        return self._hydrate([(self._meta[i], float(scores[i])) for i in idx])
+
+    def _hydrate(self, ranked: List[tuple]) -> List[Dict]:
+        """
+        Fetch text and metadata for ranked (meta, score) pairs in one query.
+
+        Ranking only needs embeddings, so chunk text stays in MongoDB until
+        the top-k winners are known — top_k documents over the wire instead
+        of the whole collection.
+
+        Args:
+            ranked: List of ({doc_id, chunk_id}, score) pairs, best first
+
+        Returns:
+            List of chunks with similarity scores, in ranked order
+        """
+        if not ranked:
+            return []
+
+        # One indexed lookup for all winners (compound doc_id+chunk_id index)
+        docs = self.mongodb.chunks.find(
+            {"$or": [{"doc_id": m["doc_id"], "chunk_id": m["chunk_id"]}
+                     for m, _ in ranked]},
+            {"doc_id": 1, "chunk_id": 1, "text": 1, "metadata": 1}
+        )
+        by_key = {(doc["doc_id"], doc["chunk_id"]): doc for doc in docs}
+
+        results = []
+        for chunk, score in ranked:
+            doc = by_key.get((chunk["doc_id"], chunk["chunk_id"]))
+            if doc is None:
+                logger.warning(f"Chunk {chunk['doc_id']}/{chunk['chunk_id']} "
+                               f"missing during hydration")
+                continue
+            results.append({
+                "doc_id": doc["doc_id"],
+                "chunk_id": doc["chunk_id"],
+                "text": doc["text"],
+                "metadata": doc.get("metadata", {}),
                 "similarity_score": score
             })
-        
+
         return results
@@ -1,7 +1,11 @@
 """Phase 3: Literature Review Pipeline - Assess facts with RAG + LLM."""
 
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
+from pymongo import UpdateOne
 from tqdm import tqdm
 import sys
 from datetime import datetime
@@ -22,13 +26,16 @@ class ReviewPipeline:
     """Pipeline for reviewing facts with RAG + LLM assessment."""
     
     def __init__(self):
+        config.ensure_dirs()
         self.mongodb = mongodb
         self.mongodb.connect()
         self.fact_loader = FactLoader()
         self.agent = AssessmentAgent()
         self.checkpoint_mgr = CheckpointManager()
         self.csv_updater = CSVUpdater()
-    
+        self._pending_ops = []
+        self._pending_results = []
+
     def run(self, test_mode: bool = False, test_count: int = 10):
         """
         Run the complete review pipeline.
@@ -54,47 +61,102 @@ class ReviewPipeline:
         facts_to_process = [f for f in facts if f["fact_number"] > last_completed]
         
         logger.info(f"Processing {len(facts_to_process)} facts (starting from #{last_completed + 1})")
-        
-        # Process each fact
+
+        # Embed all fact texts up front in a few batched calls instead of
+        # one embedding request per retrieval
+        fact_embeddings = []
+        if facts_to_process:
+            fact_embeddings = self.agent.retriever.embedder.embed_batch(
+                [f["fact_text"] for f in facts_to_process], batch_size=64
+            )
+
+
+        # Process each fact. Retrievals run on their own small pool so the
+        # Mongo/vector-search latency for upcoming facts is hidden behind
+        # the current LLM call; assessments run on a thread pool so the next
+        # LLM call is already in flight while results are written to
+        # MongoDB/CSV. Results are consumed in fact order
         start_time = time.time()
-        
-        with tqdm(total=len(facts_to_process), desc="Reviewing facts") as pbar:
-            for fact in facts_to_process:
-                fact_number = fact["fact_number"]
-                
-                try:
-                    # Assess fact
-                    fact_start = time.time()
-                    assessment = self.agent.assess_fact(fact)
-                    fact_time = time.time() - fact_start
-                    
-                    # Store in MongoDB
-                    self.mongodb.assessments.update_one(
-                        {"fact_number": fact_number},
-                        {"$set": {
-                            "fact_number": fact_number,
-                            "assessment_result": assessment,
-                            "processing_time_seconds": fact_time,
-                            "llm_model": config.LLM_MODEL,
-                            "created_at": datetime.now()
-                        }},
-                        upsert=True
-                    )
-                    
-                    # Update CSV
-                    self.csv_updater.update_fact(fact_number, assessment)
-                    
-                    # Update checkpoint
-                    self.checkpoint_mgr.update_checkpoint(checkpoint, fact_number, success=True)
-                    
-                    pbar.update(1)
-                    pbar.set_postfix({"score": assessment.get("score", "N/A"), "time": f"{fact_time:.1f}s"})
-                    
-                except Exception as e:
-                    logger.error(f"Failed to process fact #{fact_number}: {e}")
-                    self.checkpoint_mgr.update_checkpoint(checkpoint, fact_number, success=False)
-                    pbar.update(1)
-        
+        flush_every = 10
+        # Fact results whose Mongo/CSV writes are still queued; the
+        # checkpoint WAL only advances for a fact once its data has been
+        # flushed, so an interrupt can never mark unflushed facts completed
+        self._pending_results = []
+
+        # Keep only a small window of facts in flight instead of queuing the
+        # whole backlog: bounds memory held by prefetched chunks, and on
+        # Ctrl-C the queued (not yet started) futures are cancelled so
+        # shutdown waits for the current fact only
+        window = max(8, config.LLM_PARALLELISM * 2)
+        remaining = iter(zip(facts_to_process, fact_embeddings))
+
+        with ThreadPoolExecutor(max_workers=2) as retrieve_pool, \
+                ThreadPoolExecutor(max_workers=config.LLM_PARALLELISM) as executor, \
+                tqdm(total=len(facts_to_process), desc="Reviewing facts") as pbar:
+
+            def submit_one(fact, embedding):
+                chunks_future = retrieve_pool.submit(
+                    self.agent.retriever.retrieve_with_vec, embedding)
+                return (fact, chunks_future,
+                        executor.submit(self._assess_timed, fact, embedding, chunks_future))
+
+            in_flight = deque(submit_one(fact, embedding)
+                              for fact, embedding in islice(remaining, window))
+
+            try:
+                i = 0
+                while in_flight:
+                    fact, _, future = in_flight.popleft()
+                    i += 1
+                    fact_number = fact["fact_number"]
+
+                    try:
+                        # Assess fact
+                        assessment, fact_time = future.result()
+
+                        # Queue for MongoDB, flushed in bulk
+                        self._pending_ops.append(UpdateOne(
+                            {"fact_number": fact_number},
+                            {"$set": {
+                                "fact_number": fact_number,
+                                "assessment_result": assessment,
+                                "processing_time_seconds": fact_time,
+                                "llm_model": config.LLM_MODEL,
+                                "created_at": datetime.now()
+                            }},
+                            upsert=True
+                        ))
+
+                        # Update CSV (in memory; flushed periodically below)
+                        self.csv_updater.update_fact(fact_number, assessment)
+
+                        self._pending_results.append((fact_number, True))
+                        if i % flush_every == 0:
+                            self._flush_all(checkpoint)
+
+                        pbar.update(1)
+                        pbar.set_postfix({"score": assessment.get("score", "N/A"), "time": f"{fact_time:.1f}s"})
+
+                    except Exception as e:
+                        logger.error(f"Failed to process fact #{fact_number}: {e}")
+                        self._pending_results.append((fact_number, False))
+                        pbar.update(1)
+
+                    # Refill the window with the next fact, if any
+                    nxt = next(remaining, None)
+                    if nxt is not None:
+                        in_flight.append(submit_one(*nxt))
+            finally:
+                # Drop queued work so executor shutdown does not drain the
+                # rest of the backlog after an interrupt
+                for _, chunks_future, future in in_flight:
+                    future.cancel()
+                    chunks_future.cancel()
+                # Flush data and snapshot even on interrupt/crash, so the
+                # checkpoint and the written results always agree
+                self._flush_all(checkpoint)
+                self.checkpoint_mgr.save_checkpoint(checkpoint)
+
         # Final summary
         total_time = time.time() - start_time
         avg_time = total_time / len(facts_to_process) if facts_to_process else 0
@@ -108,6 +170,33 @@ class ReviewPipeline:
         logger.info(f"  Assessments in DB: {self.mongodb.assessments.count_documents({})}")
         logger.info("="*60)
 
+    def _flush_assessments(self):
+        """Write queued assessment upserts to MongoDB in one bulk call."""
+        if not self._pending_ops:
+            return
+        self.mongodb.assessments.bulk_write(self._pending_ops, ordered=False)
+        self._pending_ops.clear()
+
+    def _flush_all(self, checkpoint):
+        """Flush queued Mongo/CSV writes, then advance the checkpoint WAL.
+
+        Ordering matters: a fact reaches the WAL only after its assessment
+        and CSV updates are on disk, so a crash re-processes at most the
+        unflushed tail instead of silently skipping it on resume.
+        """
+        self._flush_assessments()
+        self.csv_updater.flush()
+        for fact_number, success in self._pending_results:
+            self.checkpoint_mgr.update_checkpoint(checkpoint, fact_number, success)
+        self._pending_results.clear()
+
+    def _assess_timed(self, fact, fact_embedding=None, chunks_future=None):
+        """Assess one fact and return (assessment, elapsed seconds)."""
+        fact_start = time.time()
+        chunks = chunks_future.result() if chunks_future is not None else None
+        assessment = self.agent.assess_fact(fact, fact_embedding, relevant_chunks=chunks)
+        return assessment, time.time() - fact_start
+
 def main(test_mode: bool = False, test_count: int = 10):
     """Main entry point for Phase 3."""
     from literature_review.utils.logging_config import setup_logging
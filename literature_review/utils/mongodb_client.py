@@ -82,9 +82,15 @@ class MongoDBClient:
         # Document indexes
         self.documents.create_index("doc_id", unique=True)
         self.documents.create_index("filename")
+        self.documents.create_index("filepath", unique=True)
         
         # Chunk indexes
         self.chunks.create_index([("doc_id", 1), ("chunk_id", 1)])
+        # Partial index over the few chunks still awaiting embeddings
+        self.chunks.create_index(
+            "needs_embedding",
+            partialFilterExpression={"needs_embedding": True}
+        )
         
         # Fact indexes
         self.facts.create_index("fact_number", unique=True)
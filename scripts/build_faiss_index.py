@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Build an offline FAISS HNSW index over the chunk embeddings.
+
+Run after Phase 2; the retriever picks the index up automatically.
+Requires the optional faiss-cpu package.
+"""
+
+import pickle
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import faiss
+import numpy as np
+
+from literature_review.config import config
+from literature_review.utils.mongodb_client import mongodb
+from literature_review.phase3_review.rag_retriever import load_chunk_vectors
+
+def main():
+    mongodb.connect()
+
+    print("Loading chunk embeddings from MongoDB...")
+    vectors, meta = load_chunk_vectors(mongodb.chunks)
+
+    if not vectors:
+        print("No chunk embeddings found - run Phase 2 first")
+        return
+
+    matrix = np.vstack(vectors).astype(np.float32)
+    faiss.normalize_L2(matrix)
+
+    print(f"Building HNSW index over {len(meta)} chunks...")
+    index = faiss.IndexHNSWFlat(matrix.shape[1], 32, faiss.METRIC_INNER_PRODUCT)
+    index.add(matrix)
+
+    config.FAISS_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+    faiss.write_index(index, str(config.FAISS_INDEX_PATH))
+    with open(config.FAISS_META_PATH, 'wb') as f:
+        pickle.dump(meta, f)
+
+    print(f"Wrote {config.FAISS_INDEX_PATH} and {config.FAISS_META_PATH}")
+
+if __name__ == "__main__":
+    main()